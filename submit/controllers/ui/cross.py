@@ -22,7 +22,7 @@ from arxiv.users.domain import Session
 
 from ...util import load_submission
 from .util import user_and_client_from_session, OptGroupSelectField, \
-    validate_command
+    validate_command, EMPTY_PARAMS
 
 logger = logging.getLogger(__name__)  # pylint: disable=C0103
 
@@ -34,15 +34,29 @@ CONTACT_SUPPORT = Markup(
     ' <a href="mailto:help@arxiv.org"> arXiv support</a>.'
 )
 
+NOT_ANNOUNCED = Markup(
+    "Submission must first be announced. See <a"
+    " href='https://arxiv.org/help/cross'>the arXiv help pages</a> for"
+    " details."
+)
+
+INVALID_REQUEST = Markup(
+    "There was a problem with your request. Please try again. "
+) + CONTACT_SUPPORT
+
+SAVE_FAILED = Markup(
+    "There was a problem processing your request. Please try again. "
+) + CONTACT_SUPPORT
+
 
 class HiddenListField(HiddenField):
     def process_formdata(self, valuelist):
-        self.data = list(str(x) for x in valuelist if x)
+        self.data = [str(x) for x in valuelist if x]
 
     def process_data(self, value):
-        try:
-            self.data = list(str(v) for v in value if v)
-        except (ValueError, TypeError):
+        if isinstance(value, (list, tuple, set)):
+            self.data = [str(v) for v in value if v]
+        else:
             self.data = None
 
     def _value(self):
@@ -52,15 +66,20 @@ class HiddenListField(HiddenField):
 class CrossListForm(csrf.CSRFForm):
     """Submit a cross-list request."""
 
-    CATEGORIES = [
-        (archive['name'], [
+    CATEGORIES = tuple(
+        (archive['name'], tuple(
             (category_id, f"{category['name']} ({category_id})")
             for category_id, category in CATEGORIES.items()
             if category['in_archive'] == archive_id
-        ])
+        ))
         for archive_id, archive in ARCHIVES.items()
-    ]
-    """Categories grouped by archive."""
+    )
+    """
+    Categories grouped by archive.
+
+    This is a tuple so that fields can share it rather than copying it for
+    each form instance.
+    """
 
     ADD = 'add'
     REMOVE = 'remove'
@@ -76,11 +95,15 @@ class CrossListForm(csrf.CSRFForm):
                              false_values=('false', False, 0, '0', ''))
 
     def validate_selected(form: csrf.CSRFForm, field: Field) -> None:
-        if form.confirmed.data and not field.data:
-            raise ValidationError('Please select a category')
-        for value in field.data:
-            if value not in CATEGORIES:
-                raise ValidationError('Not a valid category')
+        if not field.data:
+            if form.confirmed.data:
+                raise ValidationError('Please select a category')
+            return
+        invalid = set(field.data) - CATEGORIES.keys()
+        if invalid:
+            raise ValidationError(
+                f'Not a valid category: {", ".join(sorted(invalid))}'
+            )
 
     def validate_category(form: csrf.CSRFForm, field: Field) -> None:
         if not form.confirmed.data and not field.data:
@@ -124,26 +147,22 @@ def request_cross(method: str, params: MultiDict, session: Session,
                   submission_id: int, **kwargs) -> Response:
     """Request cross-list classification for an announced e-print."""
     submitter, client = user_and_client_from_session(session)
-    logger.debug(f'method: {method}, submission: {submission_id}. {params}')
+    logger.debug('method: %s, submission: %s. %s', method, submission_id,
+                 params)
 
     # Will raise NotFound if there is no such submission.
     submission, submission_events = load_submission(submission_id)
 
     # The submission must be announced for this to be a cross-list request.
     if not submission.is_announced:
-        alerts.flash_failure(
-            Markup("Submission must first be announced. See <a"
-                   " href='https://arxiv.org/help/cross'>the arXiv help"
-                   " pages</a> for details."))
+        alerts.flash_failure(NOT_ANNOUNCED)
         status_url = url_for('ui.create_submission')
         return {}, status.SEE_OTHER, {'Location': status_url}
 
     if method == 'GET':
-        params = MultiDict({})
+        params = EMPTY_PARAMS
 
-    params.setdefault("confirmed", False)
-    params.setdefault("operation", CrossListForm.ADD)
-    form = CrossListForm(params)
+    form = CrossListForm(params, confirmed=False, operation=CrossListForm.ADD)
     selected = [v for v in form.selected.data if v]
     form.filter_choices(submission, session, exclude=selected)
 
@@ -169,10 +188,7 @@ def request_cross(method: str, params: MultiDict, session: Session,
             command = RequestCrossList(creator=submitter, client=client,
                                        categories=form.selected.data)
             if not validate_command(form, command, submission, 'category'):
-                alerts.flash_failure(Markup(
-                    "There was a problem with your request. Please try again."
-                    f" {CONTACT_SUPPORT}"
-                ))
+                alerts.flash_failure(INVALID_REQUEST)
                 raise BadRequest(response_data)
 
             try:    # Submit the cross-list request.
@@ -181,10 +197,7 @@ def request_cross(method: str, params: MultiDict, session: Session,
                 # This would be due to a database error, or something else
                 # that likely isn't the user's fault.
                 logger.error('Could not save cross list request event')
-                alerts.flash_failure(Markup(
-                    "There was a problem processing your request. Please try"
-                    f" again. {CONTACT_SUPPORT}"
-                ))
+                alerts.flash_failure(SAVE_FAILED)
                 raise InternalServerError(response_data) from e
 
             # Success! Send user back to the submission page.
@@ -193,19 +206,25 @@ def request_cross(method: str, params: MultiDict, session: Session,
             return {}, status.SEE_OTHER, {'Location': status_url}
         else:   # User is adding or removing a category.
             if form.operation.data:
+                # Preserves the order of selection, without duplicates.
+                categories = dict.fromkeys(selected)
                 if form.operation.data == CrossListForm.REMOVE:
-                    selected.remove(form.category.data)
+                    categories.pop(form.category.data, None)
                 elif form.operation.data == CrossListForm.ADD:
-                    selected.append(form.category.data)
+                    categories.setdefault(form.category.data, None)
+                selected = list(categories)
                 # Update the "remove" formset to reflect the change.
                 response_data['formset'] = CrossListForm.formset(selected)
                 response_data['selected'] = selected
-            # Now that we've handled the request, get a fresh form for adding
-            # more categories or submitting the request.
-            response_data['form'] = CrossListForm()
-            response_data['form'].filter_choices(submission, session,
-                                                 exclude=selected)
-            response_data['form'].operation.data = CrossListForm.ADD
+            # Now that we've handled the request, reset the form for adding
+            # more categories or submitting the request. This avoids building
+            # a second form instance.
+            form.confirmed.data = False
+            form.operation.data = CrossListForm.ADD
+            form.category.data = ''
+            form.category.choices = CrossListForm.CATEGORIES
+            form.selected.data = selected
+            form.filter_choices(submission, session, exclude=selected)
             response_data['require_confirmation'] = True
             return response_data, status.OK, {}
     return response_data, status.OK, {}
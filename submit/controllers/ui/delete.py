@@ -56,6 +56,9 @@ def delete(method: str, params: MultiDict, session: Session,
         response_data.update({'form': form})
         return response_data, status.OK, {}
     elif method == 'POST':
+        if not params.get('confirmed'):
+            # Without confirmation there is nothing to validate or do.
+            raise BadRequest(response_data)
         form = DeleteForm(params)
         response_data.update({'form': form})
         if form.validate() and form.confirmed.data:
@@ -113,6 +116,9 @@ def cancel_request(method: str, params: MultiDict, session: Session,
         response_data.update({'form': form})
         return response_data, status.OK, {}
     elif method == 'POST':
+        if not params.get('confirmed'):
+            # Without confirmation there is nothing to validate or do.
+            raise BadRequest(response_data)
         form = CancelRequestForm(params)
         response_data.update({'form': form})
         if form.validate() and form.confirmed.data:
@@ -6,9 +6,8 @@ from typing import Tuple, Dict, Any, Optional, List
 from flask import url_for, Markup
 from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import InternalServerError, NotFound, BadRequest
-from wtforms.fields import TextField, TextAreaField, Field, BooleanField
-from wtforms.validators import InputRequired, ValidationError, optional, \
-    DataRequired
+from wtforms.fields import TextField, BooleanField
+from wtforms.validators import optional
 
 from arxiv.base import logging, alerts
 from arxiv.forms import csrf
@@ -56,7 +55,8 @@ def jref(method: str, params: MultiDict, session: Session,
          submission_id: int, **kwargs) -> Response:
     """Set journal reference metadata on a announced submission."""
     creator, client = user_and_client_from_session(session)
-    logger.debug(f'method: {method}, submission: {submission_id}. {params}')
+    logger.debug('method: %s, submission: %s. %s', method, submission_id,
+                 params)
 
     # Will raise NotFound if there is no such submission.
     submission, submission_events = load_submission(submission_id)
@@ -72,14 +72,14 @@ def jref(method: str, params: MultiDict, session: Session,
     # The form should be prepopulated based on the current state of the
     # submission.
     if method == 'GET':
-        params = MultiDict({
+        form = JREFForm(data={
             'doi': submission.metadata.doi,
             'journal_ref': submission.metadata.journal_ref,
-            'report_num': submission.metadata.report_num
+            'report_num': submission.metadata.report_num,
+            'confirmed': False
         })
-
-    params.setdefault("confirmed", False)
-    form = JREFForm(params)
+    else:
+        form = JREFForm(params, confirmed=False)
     response_data = {
         'submission_id': submission_id,
         'submission': submission,
@@ -107,7 +107,7 @@ def jref(method: str, params: MultiDict, session: Session,
                 raise BadRequest(response_data)
 
             response_data['require_confirmation'] = True
-            logger.debug('Form is valid, with data: %s', str(form.data))
+            logger.debug('Form is valid, with data: %s', form.data)
             try:
                 # Save the events created during form validation.
                 submission, _ = save(*commands, submission_id=submission_id)
@@ -124,29 +124,28 @@ def jref(method: str, params: MultiDict, session: Session,
     return response_data, status.OK, {}
 
 
+_COMMANDS = (
+    ('report_num', SetReportNumber),
+    ('journal_ref', SetJournalReference),
+    ('doi', SetDOI),
+)
+"""Form fields, and the command that sets each on the submission metadata."""
+
+
 def _generate_commands(form: JREFForm, submission: Submission, creator: User,
                        client: Client) -> Tuple[List[Event], List[bool]]:
     commands: List[Event] = []
     valid: List[bool] = []
 
-    if form.report_num.data and submission.metadata \
-            and form.report_num.data != submission.metadata.report_num:
-        command = SetReportNumber(report_num=form.report_num.data,
-                                  creator=creator, client=client)
-        valid.append(validate_command(form, command, submission, 'report_num'))
-        commands.append(command)
-
-    if form.journal_ref.data and submission.metadata \
-            and form.journal_ref.data != submission.metadata.journal_ref:
-        command = SetJournalReference(journal_ref=form.journal_ref.data,
-                                      creator=creator, client=client)
-        valid.append(validate_command(form, command, submission,
-                                      'journal_ref'))
-        commands.append(command)
-
-    if form.doi.data and submission.metadata \
-            and form.doi.data != submission.metadata.doi:
-        command = SetDOI(doi=form.doi.data, creator=creator, client=client)
-        valid.append(validate_command(form, command, submission, 'doi'))
-        commands.append(command)
+    metadata = submission.metadata
+    if not metadata:
+        return commands, valid
+
+    for field, command_type in _COMMANDS:
+        value = form[field].data
+        if value and value != getattr(metadata, field):
+            command = command_type(creator=creator, client=client,
+                                   **{field: value})
+            valid.append(validate_command(form, command, submission, field))
+            commands.append(command)
     return commands, valid
@@ -7,7 +7,6 @@ Creates an event of type `core.events.event.ConfirmAuthorship`
 from http import HTTPStatus as status
 from typing import Tuple, Dict, Any, Optional
 
-from flask import url_for
 from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import InternalServerError, NotFound, BadRequest
 from wtforms import BooleanField, RadioField
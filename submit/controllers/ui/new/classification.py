@@ -7,7 +7,7 @@ Creates an event of type `core.events.event.AddSecondaryClassification`
 from typing import Tuple, Dict, Any, List, Optional
 from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import InternalServerError, BadRequest
-from flask import url_for, Markup
+from flask import Markup
 from wtforms import SelectField, widgets, HiddenField, validators
 
 from http import HTTPStatus as status
@@ -22,7 +22,7 @@ from arxiv.submission.domain.event import RemoveSecondaryClassification, \
     AddSecondaryClassification, SetPrimaryClassification
 
 from submit.controllers.ui.util import validate_command, OptGroupSelectField, \
-    user_and_client_from_session
+    user_and_client_from_session, endorsed_categories
 from submit.util import load_submission
 from submit.routes.ui.flow_control import ready_for_next, stay_on_this_stage
 
@@ -55,11 +55,12 @@ class ClassificationForm(csrf.CSRFForm):
         """Remove redundant choices, and limit to endorsed categories."""
         selected = self.category.data
         primary = submission.primary_classification
+        endorsed = endorsed_categories(session)
 
         choices = [
             (archive, [
                 (category, display) for category, display in archive_choices
-                if session.authorizations.endorsed_for(category)
+                if category in endorsed
                 and (((primary is None or category != primary.category)
                       and category not in submission.secondary_categories)
                      or category == selected)
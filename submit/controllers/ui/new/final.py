@@ -6,7 +6,6 @@ from typing import Tuple, Dict, Any
 
 from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import InternalServerError, BadRequest
-from flask import url_for
 from wtforms import BooleanField
 from wtforms.validators import InputRequired
 
@@ -30,19 +29,15 @@ def finalize(method: str, params: MultiDict, session: Session,
              submission_id: int, **kwargs) -> Response:
     submitter, client = user_and_client_from_session(session)
 
-    logger.debug(f'method: {method}, submission: {submission_id}. {params}')
+    logger.debug('method: %s, submission: %s. %s', method, submission_id,
+                 params)
     submission, submission_events = load_submission(submission_id)
 
     form = FinalizationForm(params)
-
-    # The abs preview macro expects a specific struct for submission history.
-    submission_history = [{'submitted_date': s.created, 'version': s.version}
-                          for s in submission.versions]
     response_data = {
         'submission_id': submission_id,
         'form': form,
         'submission': submission,
-        'submission_history': submission_history
     }
 
     command = FinalizeSubmission(creator=submitter)
@@ -58,10 +53,14 @@ def finalize(method: str, params: MultiDict, session: Session,
             raise InternalServerError(response_data) from e
         return ready_for_next((response_data, status.OK, {}))
     else:
+        # The abs preview macro expects a specific struct for submission
+        # history. This is only needed when the preview is actually rendered.
+        response_data['submission_history'] = [
+            {'submitted_date': s.created, 'version': s.version}
+            for s in submission.versions
+        ]
         return stay_on_this_stage((response_data, status.OK, {}))
 
-    return response_data, status.OK, {}
-
 
 class FinalizationForm(csrf.CSRFForm):
     """Make sure the user is really really really ready to submit."""
@@ -5,9 +5,8 @@ Creates an event of type `core.events.event.SetLicense`
 """
 
 from http import HTTPStatus as status
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, FrozenSet
 
-from flask import url_for
 from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import InternalServerError, BadRequest
 from wtforms.fields import RadioField
@@ -39,9 +38,9 @@ def license(method: str, params: MultiDict, session: Session,
     if method == 'GET' and submission.license:
         # The form should be prepopulated based on the current state of the
         # submission.
-        params['license'] = submission.license.uri
-
-    form = LicenseForm(params)
+        form = LicenseForm(data={'license': submission.license.uri})
+    else:
+        form = LicenseForm(params)
     response_data = {
         'submission_id': submission_id,
         'form': form,
@@ -66,11 +65,33 @@ def license(method: str, params: MultiDict, session: Session,
     return stay_on_this_stage((response_data, status.OK, {}))
 
 
+class LicenseField(RadioField):
+    """A radio field that checks its value against a set of license URIs."""
+
+    def __init__(self, *args: Any, uris: FrozenSet[str] = frozenset(),
+                 **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.uris = uris
+
+    def pre_validate(self, form: csrf.CSRFForm) -> None:
+        """Check the selected license with a set lookup."""
+        if self.data not in self.uris:
+            raise ValueError(self.gettext('Not a valid choice'))
+
+
 class LicenseForm(csrf.CSRFForm):
     """Generate form to select license."""
 
-    LICENSE_CHOICES = [(uri, data['label']) for uri, data in LICENSES.items()
-                       if data['is_current']]
+    LICENSE_CHOICES = tuple((uri, data['label'])
+                            for uri, data in LICENSES.items()
+                            if data['is_current'])
+    """Current licenses, shared (not copied) by each bound license field."""
+
+    LICENSE_URIS = frozenset(uri for uri, _ in LICENSE_CHOICES)
+    """URIs of the current licenses, for validation."""
 
-    license = RadioField(u'Select a license', choices=LICENSE_CHOICES,
-                         validators=[InputRequired('Please select a license')])
+    license = LicenseField(u'Select a license', choices=LICENSE_CHOICES,
+                           uris=LICENSE_URIS,
+                           validators=[
+                               InputRequired('Please select a license')
+                           ])
@@ -77,71 +77,45 @@ class OptionalMetadataForm(csrf.CSRFForm, FieldMixin):
                                        "14J26 (Secondary)"))
 
 
-def _data_from_submission(params: MultiDict, submission: Submission,
-                          form_class: type) -> MultiDict:
-    if not submission.metadata:
-        return params
-    for field in form_class.fields():
-        params[field] = getattr(submission.metadata, field, '')
-    return params
+def _data_from_submission(submission: Submission,
+                          form_class: type) -> Dict[str, Any]:
+    metadata = submission.metadata
+    if not metadata:
+        return {}
+    return {field: getattr(metadata, field, '')
+            for field in form_class.fields()}
 
 
 def metadata(method: str, params: MultiDict, session: Session,
              submission_id: int, **kwargs) -> Response:
     """Update metadata on the submission."""
-    submitter, client = user_and_client_from_session(session)
-    logger.debug(f'method: {method}, submission: {submission_id}. {params}')
-
-    # Will raise NotFound if there is no such submission.
-    submission, submission_events = load_submission(submission_id)
-    # The form should be prepopulated based on the current state of the
-    # submission.
-    if method == 'GET':
-        params = _data_from_submission(params, submission, CoreMetadataForm)
-
-    form = CoreMetadataForm(params)
-    response_data = {
-        'submission_id': submission_id,
-        'form': form,
-        'submission': submission
-    }
-
-    if method == 'POST' and form.validate():
-        commands, valid = _commands(form, submission, submitter, client)
-        # We only want to apply an UpdateMetadata if the metadata has
-        # actually changed.
-        if commands and all(valid):   # Metadata has changed and is valid
-            try:
-                # Save the events created during form validation.
-                submission, _ = save(*commands, submission_id=submission_id)
-                response_data['submission'] = submission
-                return ready_for_next((response_data, status.OK, {}))
-            except SaveError as e:
-                raise InternalServerError(response_data) from e
-        else:
-            return ready_for_next((response_data, status.OK, {}))
-    else:
-        return stay_on_this_stage((response_data, status.OK, {}))
-
-    return response_data, status.OK, {}
+    return _update_metadata(CoreMetadataForm, _CORE_COMMANDS, method, params,
+                            session, submission_id)
 
 
 def optional(method: str, params: MultiDict, session: Session,
              submission_id: int, **kwargs) -> Response:
     """Update optional metadata on the submission."""
+    return _update_metadata(OptionalMetadataForm, _OPTIONAL_COMMANDS, method,
+                            params, session, submission_id)
+
+
+def _update_metadata(form_class: type, fields: Tuple[Tuple[str, type], ...],
+                     method: str, params: MultiDict, session: Session,
+                     submission_id: int) -> Response:
     submitter, client = user_and_client_from_session(session)
 
-    logger.debug(f'method: {method}, submission: {submission_id}. {params}')
+    logger.debug('method: %s, submission: %s. %s', method, submission_id,
+                 params)
 
     # Will raise NotFound if there is no such submission.
     submission, submission_events = load_submission(submission_id)
     # The form should be prepopulated based on the current state of the
     # submission.
     if method == 'GET':
-        params = _data_from_submission(params, submission,
-                                       OptionalMetadataForm)
-
-    form = OptionalMetadataForm(params)
+        form = form_class(data=_data_from_submission(submission, form_class))
+    else:
+        form = form_class(params)
     response_data = {
         'submission_id': submission_id,
         'form': form,
@@ -149,9 +123,10 @@ def optional(method: str, params: MultiDict, session: Session,
     }
 
     if method == 'POST' and form.validate():
-        logger.debug('Form is valid, with data: %s', str(form.data))
+        logger.debug('Form is valid, with data: %s', form.data)
 
-        commands, valid = _opt_commands(form, submission, submitter, client)
+        commands, valid = _generate_commands(form, submission, submitter,
+                                             client, fields)
         # We only want to apply updates if the metadata has actually changed.
         if not commands:
             return ready_for_next((response_data, status.OK, {}))
@@ -166,82 +141,41 @@ def optional(method: str, params: MultiDict, session: Session,
     return stay_on_this_stage((response_data, status.OK, {}))
 
 
-def _commands(form: CoreMetadataForm, submission: Submission,
-              creator: User, client: Client) -> Tuple[List[Event], List[bool]]:
-    commands: List[Event] = []
-    valid: List[bool] = []
+_CORE_COMMANDS = (
+    ('title', SetTitle),
+    ('abstract', SetAbstract),
+    ('comments', SetComments),
+    ('authors_display', SetAuthors),
+)
+"""Core metadata fields, and the command that sets each on the submission."""
 
-    if form.title.data and submission.metadata \
-            and form.title.data != submission.metadata.title:
-        command = SetTitle(title=form.title.data, creator=creator,
-                           client=client)
-        valid.append(validate_command(form, command, submission, 'title'))
-        commands.append(command)
-
-    if form.abstract.data and submission.metadata \
-            and form.abstract.data != submission.metadata.abstract:
-        command = SetAbstract(abstract=form.abstract.data, creator=creator,
-                              client=client)
-        valid.append(validate_command(form, command, submission, 'abstract'))
-        commands.append(command)
-
-    if form.comments.data and submission.metadata \
-            and form.comments.data != submission.metadata.comments:
-        command = SetComments(comments=form.comments.data, creator=creator,
-                              client=client)
-        valid.append(validate_command(form, command, submission, 'comments'))
-        commands.append(command)
-
-    value = form.authors_display.data
-    if value and submission.metadata \
-            and value != submission.metadata.authors_display:
-        command = SetAuthors(authors_display=form.authors_display.data,
-                             creator=creator, client=client)
-        valid.append(validate_command(form, command, submission,
-                                      'authors_display'))
-        commands.append(command)
-    return commands, valid
+_OPTIONAL_COMMANDS = (
+    ('msc_class', SetMSCClassification),
+    ('acm_class', SetACMClassification),
+    ('report_num', SetReportNumber),
+    ('journal_ref', SetJournalReference),
+    ('doi', SetDOI),
+)
+"""Optional metadata fields, and the command that sets each."""
 
 
-def _opt_commands(form: OptionalMetadataForm, submission: Submission,
-                  creator: User, client: Client) \
+def _generate_commands(form: csrf.CSRFForm, submission: Submission,
+                       creator: User, client: Client,
+                       fields: Tuple[Tuple[str, type], ...]) \
         -> Tuple[List[Event], List[bool]]:
-
+    """Generate and validate commands for the fields that have changed."""
     commands: List[Event] = []
     valid: List[bool] = []
 
-    if form.msc_class.data and submission.metadata \
-            and form.msc_class.data != submission.metadata.msc_class:
-        command = SetMSCClassification(msc_class=form.msc_class.data,
-                                       creator=creator, client=client)
-        valid.append(validate_command(form, command, submission, 'msc_class'))
-        commands.append(command)
-
-    if form.acm_class.data and submission.metadata \
-            and form.acm_class.data != submission.metadata.acm_class:
-        command = SetACMClassification(acm_class=form.acm_class.data,
-                                       creator=creator, client=client)
-        valid.append(validate_command(form, command, submission, 'acm_class'))
-        commands.append(command)
-
-    if form.report_num.data and submission.metadata \
-            and form.report_num.data != submission.metadata.report_num:
-        command = SetReportNumber(report_num=form.report_num.data,
-                                  creator=creator, client=client)
-        valid.append(validate_command(form, command, submission, 'report_num'))
-        commands.append(command)
-
-    if form.journal_ref.data and submission.metadata \
-            and form.journal_ref.data != submission.metadata.journal_ref:
-        command = SetJournalReference(journal_ref=form.journal_ref.data,
-                                      creator=creator, client=client)
-        valid.append(validate_command(form, command, submission,
-                                      'journal_ref'))
-        commands.append(command)
-
-    if form.doi.data and submission.metadata \
-            and form.doi.data != submission.metadata.doi:
-        command = SetDOI(doi=form.doi.data, creator=creator, client=client)
-        valid.append(validate_command(form, command, submission, 'doi'))
-        commands.append(command)
+    metadata = submission.metadata
+    if not metadata:
+        return commands, valid
+
+    for field, command_type in fields:
+        value = form[field].data
+        if value and value != getattr(metadata, field):
+            command = command_type(creator=creator, client=client,
+                                   **{field: value})
+            valid.append(validate_command(form, command, submission, field))
+            commands.append(command)
     return commands, valid
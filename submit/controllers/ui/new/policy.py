@@ -6,7 +6,6 @@ Creates an event of type `core.events.event.ConfirmPolicy`
 from http import HTTPStatus as status
 from typing import Tuple, Dict, Any
 
-from flask import url_for
 from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import InternalServerError, BadRequest
 from wtforms import BooleanField
@@ -32,10 +31,10 @@ def policy(method: str, params: MultiDict, session: Session,
     submitter, client = user_and_client_from_session(session)
     submission, submission_events = load_submission(submission_id)
 
-    if method == 'GET' and submission.submitter_accepts_policy:
-        params['policy'] = 'true'
-
-    form = PolicyForm(params)
+    if method == 'GET':
+        form = PolicyForm(data={'policy': submission.submitter_accepts_policy})
+    else:
+        form = PolicyForm(params)
     response_data = {
         'submission_id': submission_id,
         'form': form,
@@ -25,7 +25,8 @@ from werkzeug.exceptions import InternalServerError, NotFound, MethodNotAllowed
 from wtforms import SelectField
 from .reasons import TEX_PRODUCED_MARKUP, DOCKER_ERROR_MARKUOP, SUCCESS_MARKUP
 from submit.controllers.ui.util import user_and_client_from_session
-from submit.routes.ui.flow_control import ready_for_next, stay_on_this_stage
+from submit.routes.ui.flow_control import ready_for_next, \
+    stay_on_this_stage, FLOW_ACTIONS
 from submit.util import load_submission
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,12 @@ SUPPORT = Markup(
     ' <a href="mailto:help@arxiv.org"> arXiv support</a>.'
 )
 
+REQUEST_FAILED = Markup(
+    'There was a problem carrying out your request. Please try again. '
+) + SUPPORT
+
+PROCESSING_FAILED = Markup("We couldn't process your submission. ") + SUPPORT
+
 
 def file_process(method: str, params: MultiDict, session: Session,
                  submission_id: int, token: str, **kwargs: Any) -> Response:
@@ -72,7 +79,7 @@ def file_process(method: str, params: MultiDict, session: Session,
     if method == "GET":
         return compile_status(params, session, submission_id, token)
     elif method == "POST":
-        if params.get('action') in ['previous', 'next', 'save_exit']:
+        if params.get('action') in FLOW_ACTIONS:
             return _check_status(params, session, submission_id, token)
             # User is not actually trying to process anything; let flow control
             # in the routes handle the response.
@@ -104,10 +111,7 @@ def _check_status(params: MultiDict, session: Session,  submission_id: int,
             submission, _ = save(command, submission_id=submission_id)
             return ready_for_next(({}, status.OK, {}))
         except SaveError as e:
-            alerts.flash_failure(Markup(
-                'There was a problem carrying out your request. Please'
-                f' try again. {SUPPORT}'
-            ))
+            alerts.flash_failure(REQUEST_FAILED)
             logger.error('Error while saving command %s: %s',
                          command.event_id, e)
             raise InternalServerError('Could not save changes') from e
@@ -161,10 +165,7 @@ def compile_status(params: MultiDict, session: Session, submission_id: int,
         pass
     except process_source.FailedToCheckStatus as e:
         logger.error('Failed to check status: %s', e)
-        alerts.flash_failure(Markup(
-            'There was a problem carrying out your request. Please try'
-            f' again. {SUPPORT}'
-        ))
+        alerts.flash_failure(REQUEST_FAILED)
     if result is not None:
         response_data['status'] = result.status
         response_data.update(**result.extra)
@@ -189,7 +190,7 @@ def start_compilation(params: MultiDict, session: Session, submission_id: int,
     try:
         result = process_source.start(submission, submitter, client, token)
     except process_source.FailedToStart as e:
-        alerts.flash_failure(f"We couldn't process your submission. {SUPPORT}",
+        alerts.flash_failure(PROCESSING_FAILED,
                              title="Processing failed")
         logger.error('Error while requesting compilation for %s: %s',
                      submission_id, e)
@@ -215,24 +216,21 @@ def start_compilation(params: MultiDict, session: Session, submission_id: int,
 def file_preview(params, session: Session, submission_id: int, token: str,
                  **kwargs: Any) -> Tuple[io.BytesIO, int, Dict[str, str]]:
     """Serve the PDF preview for a submission."""
-    submitter, client = user_and_client_from_session(session)
-    submission, submission_events = load_submission(submission_id)
+    submission, _ = load_submission(submission_id)
+    source = submission.source_content
     p = PreviewService.current_session()
-    stream, pdf_checksum = p.get(submission.source_content.identifier,
-                                 submission.source_content.checksum,
-                                 token)
+    stream, pdf_checksum = p.get(source.identifier, source.checksum, token)
     headers = {'Content-Type': 'application/pdf', 'ETag': pdf_checksum}
     return stream, status.OK, headers
 
 
 def compilation_log(params, session: Session, submission_id: int, token: str,
                     **kwargs: Any) -> Response:
-    submitter, client = user_and_client_from_session(session)
-    submission, submission_events = load_submission(submission_id)
-    checksum = params.get('checksum', submission.source_content.checksum)
+    submission, _ = load_submission(submission_id)
+    source = submission.source_content
+    checksum = params.get('checksum', source.checksum)
     try:
-        log = Compiler.get_log(submission.source_content.identifier, checksum,
-                               token)
+        log = Compiler.get_log(source.identifier, checksum, token)
         headers = {'Content-Type': log.content_type, 'ETag': checksum}
         return log.stream, status.OK, headers
     except exceptions.NotFound:
@@ -249,9 +247,9 @@ class CompilationForm(csrf.CSRFForm):
     """Generate form to process compilation."""
 
     PDFLATEX = 'pdflatex'
-    COMPILERS = [
-        (PDFLATEX, 'PDFLaTeX')
-    ]
+    COMPILERS = (
+        (PDFLATEX, 'PDFLaTeX'),
+    )
 
     compiler = SelectField('Compiler', choices=COMPILERS,
                            default=PDFLATEX)
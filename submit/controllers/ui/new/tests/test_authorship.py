@@ -19,12 +19,13 @@ from submit.routes.ui.flow_control import get_controllers_desire, STAGE_RESHOW
 class TestVerifyAuthorship(TestCase):
     """Test behavior of :func:`.authorship` controller."""
 
-    def setUp(self):
-        """Create an authenticated session."""
+    @classmethod
+    def setUpClass(cls):
+        """Create an authenticated session, shared by all of the tests."""
         # Specify the validity period for the session.
         start = datetime.now(tz=timezone('US/Eastern'))
         end = start + timedelta(seconds=36000)
-        self.session = domain.Session(
+        cls.session = domain.Session(
             session_id='123-session-abc',
             start_time=start, end_time=end,
             user=domain.User(
@@ -136,6 +136,35 @@ class TestClassification(TestCase):
 
         self.assertIsInstance(data['form'], Form, "Data includes a form")
 
+    @mock.patch(f'{classification.__name__}.ClassificationForm.Meta.csrf',
+                False)
+    def test_filter_choices_by_endorsement(self):
+        """Choices are limited to the categories the user is endorsed for."""
+        submission = mock.MagicMock(primary_classification=None,
+                                    secondary_categories=[])
+        for endorsements in [(), ('astro-ph.CO', 'astro-ph.GA'),
+                             ('astro-ph.*',), ('astro-ph.*', 'cs.AI'),
+                             ('*.*',)]:
+            authorizations = self.session.authorizations._replace(
+                endorsements=[domain.Category(c) for c in endorsements]
+            )
+            session = self.session._replace(authorizations=authorizations)
+            expected = [
+                (archive, [
+                    (category, display) for category, display in choices
+                    if authorizations.endorsed_for(category)
+                ])
+                for archive, choices in
+                classification.ClassificationForm.CATEGORIES
+            ]
+            expected = [(archive, choices) for archive, choices in expected
+                        if choices]
+
+            form = classification.ClassificationForm()
+            form.filter_choices(submission, session)
+            self.assertEqual(form.category.choices, expected,
+                             f"Endorsed for {endorsements}")
+
 
 class TestCrossList(TestCase):
     """Test behavior of :func:`.cross_list` controller."""
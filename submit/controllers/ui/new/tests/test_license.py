@@ -15,7 +15,8 @@ from arxiv.users import auth, domain
 
 from submit.controllers.ui.new import license
 
-from submit.routes.ui.flow_control import get_controllers_desire, STAGE_SUCCESS
+from submit.routes.ui.flow_control import get_controllers_desire, \
+    STAGE_SUCCESS, STAGE_RESHOW
 
 class TestSetLicense(TestCase):
     """Test behavior of :func:`.license` controller."""
@@ -163,3 +164,23 @@ class TestSetLicense(TestCase):
         except InternalServerError as e:
             data = e.description
             self.assertIsInstance(data['form'], Form, "Data includes a form")
+
+    @mock.patch(f'{license.__name__}.LicenseForm.Meta.csrf', False)
+    @mock.patch(f'{license.__name__}.save')
+    @mock.patch('arxiv.submission.load')
+    def test_post_request_with_unknown_license(self, mock_load, mock_save):
+        """POST request with a `license` that is not a current license."""
+        submission_id = 2
+        sub = mock.MagicMock(submission_id=submission_id, is_finalized=False)
+        mock_load.return_value = (sub, [])
+
+        params = MultiDict({
+            'license': 'http://example.com/not-a-license',
+            'action': 'next'
+        })
+        data, code, _ = license.license('POST', params, self.session,
+                                        submission_id)
+        self.assertEqual(code, status.OK)
+        self.assertEqual(get_controllers_desire(data), STAGE_RESHOW)
+        self.assertIn('license', data['form'].errors)
+        self.assertEqual(mock_save.call_count, 0, "No license is set")
@@ -16,6 +16,7 @@ from arxiv.submission.domain.event import SetTitle, SetAbstract, SetAuthors, \
 from arxiv.users import auth, domain
 
 from submit.controllers.ui.new import metadata
+from submit.routes.ui.flow_control import get_controllers_desire, STAGE_RESHOW
 
 
 class TestOptional(TestCase):
@@ -206,6 +207,40 @@ class TestOptional(TestCase):
         self.assertIn(SetMSCClassification, event_types, "Sets msc")
         self.assertEqual(len(event_types), 2, "Only two events are generated")
 
+    @mock.patch(f'{metadata.__name__}.OptionalMetadataForm.Meta.csrf', False)
+    @mock.patch(f'{metadata.__name__}.save')
+    @mock.patch('arxiv.submission.load')
+    def test_post_request_invalid_data(self, mock_load, mock_save):
+        """POST request with a change that does not pass validation."""
+        submission_id = 2
+        mock_submission = mock.MagicMock(
+            submission_id=submission_id,
+            is_finalized=False,
+            metadata=mock.MagicMock(**{
+                'doi': '10.0001/123456',
+                'journal_ref': 'foo journal 10 2010: 12-345',
+                'report_num': 'foo report 12',
+                'acm_class': 'F.2.2; I.2.7',
+                'msc_class': '14J26'
+            })
+        )
+        mock_load.return_value = (mock_submission, [])
+        mock_save.return_value = (mock_submission, [])
+        params = MultiDict({
+            'doi': 'not a doi',
+            'journal_ref': 'foo journal 10 2010: 12-345',
+            'report_num': 'foo report 13',
+            'acm_class': 'F.2.2; I.2.7',
+            'msc_class': '14J26'
+        })
+        data, code, _ = metadata.optional('POST', params, self.session,
+                                          submission_id)
+        self.assertEqual(code, status.OK, "Returns 200 OK")
+        self.assertIsInstance(data['form'], Form, "Data includes a form")
+        self.assertEqual(get_controllers_desire(data), STAGE_RESHOW,
+                         "Stays on the stage")
+        self.assertEqual(mock_save.call_count, 0, "Nothing is saved")
+
 
 class TestMetadata(TestCase):
     """Tests for :func:`.metadata`."""
@@ -374,6 +409,9 @@ class TestMetadata(TestCase):
         })
         data, _, _ = metadata.metadata('POST', params, self.session, submission_id)
         self.assertIsInstance(data['form'], Form, "Data includes a form")
+        self.assertEqual(get_controllers_desire(data), STAGE_RESHOW,
+                         "Stays on the stage")
+        self.assertEqual(mock_save.call_count, 0, "Nothing is saved")
 
     @mock.patch(f'{metadata.__name__}.CoreMetadataForm.Meta.csrf', False)
     @mock.patch(f'{metadata.__name__}.save')
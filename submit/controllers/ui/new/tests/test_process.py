@@ -0,0 +1,118 @@
+"""Tests for :mod:`submit.controllers.ui.new.process`."""
+
+from datetime import timedelta, datetime
+from http import HTTPStatus as status
+from unittest import TestCase, mock
+
+from pytz import timezone
+from werkzeug.datastructures import MultiDict
+
+from arxiv.submission.process import process_source
+from arxiv.users import auth, domain
+
+from submit.controllers.ui.new import process
+
+from submit.routes.ui.flow_control import get_controllers_desire, STAGE_RESHOW
+
+
+class TestStartCompilation(TestCase):
+    """Test behavior of :func:`.file_process` when processing is requested."""
+
+    def setUp(self):
+        """Create an authenticated session."""
+        # Specify the validity period for the session.
+        start = datetime.now(tz=timezone('US/Eastern'))
+        end = start + timedelta(seconds=36000)
+        self.session = domain.Session(
+            session_id='123-session-abc',
+            start_time=start, end_time=end,
+            user=domain.User(
+                user_id='235678',
+                email='foo@foo.com',
+                username='foouser',
+                name=domain.UserFullName("Jane", "Bloggs", "III"),
+                profile=domain.UserProfile(
+                    affiliation="FSU",
+                    rank=3,
+                    country="de",
+                    default_category=domain.Category('astro-ph.GA'),
+                    submission_groups=['grp_physics']
+                )
+            ),
+            authorizations=domain.Authorizations(
+                scopes=[auth.scopes.CREATE_SUBMISSION,
+                        auth.scopes.EDIT_SUBMISSION,
+                        auth.scopes.VIEW_SUBMISSION],
+                endorsements=[domain.Category('astro-ph.CO'),
+                              domain.Category('astro-ph.GA')]
+            )
+        )
+
+    def _submission(self, preview_checksum):
+        """Make a submission with processed source and a preview."""
+        return mock.MagicMock(
+            submission_id=2,
+            is_source_processed=True,
+            source_content=mock.MagicMock(identifier='5678',
+                                          checksum='a1s2d3f4'),
+            preview=mock.MagicMock(source_checksum=preview_checksum)
+        )
+
+    def _post(self, params):
+        """POST to the processing stage for submission 2."""
+        return process.file_process('POST', params, self.session, 2, 'footoken')
+
+    @mock.patch(f'{process.__name__}.alerts', mock.MagicMock())
+    @mock.patch(f'{process.__name__}.CompilationForm.Meta.csrf', False)
+    @mock.patch(f'{process.__name__}.process_source.start')
+    @mock.patch('arxiv.submission.load')
+    def test_already_processed(self, mock_load, mock_start):
+        """The preview was produced from the current source."""
+        mock_load.return_value = (self._submission('a1s2d3f4'), [])
+        mock_start.return_value = process_source.CheckResult(
+            status=process_source.SUCCEEDED,
+            extra={'log_output': 'foolog'}
+        )
+        data, code, _ = self._post(MultiDict({'compiler': 'pdflatex'}))
+        self.assertEqual(code, status.OK)
+        self.assertEqual(mock_start.call_count, 1, 'Processing is started')
+        self.assertEqual(data['status'], process_source.SUCCEEDED)
+        self.assertEqual(data['log_output'], 'foolog')
+        self.assertEqual(get_controllers_desire(data), STAGE_RESHOW)
+
+    @mock.patch(f'{process.__name__}.alerts', mock.MagicMock())
+    @mock.patch(f'{process.__name__}.CompilationForm.Meta.csrf', False)
+    @mock.patch(f'{process.__name__}.process_source.start')
+    @mock.patch('arxiv.submission.load')
+    def test_source_changed(self, mock_load, mock_start):
+        """The preview was produced from an earlier version of the source."""
+        mock_load.return_value = (self._submission('oldchecksum'), [])
+        mock_start.return_value = process_source.CheckResult(
+            status=process_source.IN_PROGRESS,
+            extra={}
+        )
+        data, code, _ = self._post(MultiDict({'compiler': 'pdflatex'}))
+        self.assertEqual(code, status.OK)
+        self.assertEqual(mock_start.call_count, 1, 'Processing is started')
+        self.assertEqual(data['status'], process_source.IN_PROGRESS)
+
+    @mock.patch(f'{process.__name__}.alerts')
+    @mock.patch(f'{process.__name__}.CompilationForm.Meta.csrf', False)
+    @mock.patch(f'{process.__name__}.process_source.start')
+    @mock.patch('arxiv.submission.load')
+    def test_reprocess(self, mock_load, mock_start, mock_alerts):
+        """The user clicks Reprocess on a submission that has succeeded."""
+        mock_load.return_value = (self._submission('a1s2d3f4'), [])
+        mock_start.return_value = process_source.CheckResult(
+            status=process_source.FAILED,
+            extra={'reason': 'docker failed', 'log_output': 'foolog'}
+        )
+        # The Reprocess button does not submit an action.
+        data, code, _ = self._post(MultiDict())
+        self.assertEqual(code, status.OK)
+        self.assertEqual(mock_start.call_count, 1, 'Processing is started')
+        self.assertEqual(data['status'], process_source.FAILED)
+        self.assertEqual(data['reason'], 'docker failed')
+        self.assertEqual(data['log_output'], 'foolog')
+        self.assertEqual(mock_alerts.flash_failure.call_count, 1,
+                         'The failure is reported to the user')
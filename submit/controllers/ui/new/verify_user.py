@@ -6,7 +6,6 @@ Creates an event of type `core.events.event.ConfirmContactInformation`
 from http import HTTPStatus as status
 from typing import Tuple, Dict, Any, Optional
 
-from flask import url_for
 from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import InternalServerError, NotFound, BadRequest
 from wtforms import BooleanField
@@ -35,7 +34,8 @@ def verify(method: str, params: MultiDict, session: Session,
 
     Generates a `ConfirmContactInformation` event when valid data are POSTed.
     """
-    logger.debug(f'method: {method}, submission: {submission_id}. {params}')
+    logger.debug('method: %s, submission: %s. %s', method, submission_id,
+                 params)
     submitter, client = user_and_client_from_session(session)
 
     # Will raise NotFound if there is no such submission.
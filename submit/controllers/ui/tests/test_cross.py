@@ -0,0 +1,108 @@
+"""Tests for :mod:`submit.controllers.cross`."""
+
+from unittest import TestCase, mock
+from werkzeug.datastructures import MultiDict
+from http import HTTPStatus as status
+from submit.controllers.ui import cross
+
+from pytz import timezone
+from datetime import timedelta, datetime
+from arxiv.users import auth, domain
+
+
+class TestRequestCrossList(TestCase):
+    """Test behavior of :func:`.request_cross` controller."""
+
+    def setUp(self):
+        """Create an authenticated session."""
+        # Specify the validity period for the session.
+        start = datetime.now(tz=timezone('US/Eastern'))
+        end = start + timedelta(seconds=36000)
+        self.session = domain.Session(
+            session_id='123-session-abc',
+            start_time=start, end_time=end,
+            user=domain.User(
+                user_id='235678',
+                email='foo@foo.com',
+                username='foouser',
+                name=domain.UserFullName("Jane", "Bloggs", "III"),
+                profile=domain.UserProfile(
+                    affiliation="FSU",
+                    rank=3,
+                    country="de",
+                    default_category=domain.Category('astro-ph.GA'),
+                    submission_groups=['grp_physics']
+                )
+            ),
+            authorizations=domain.Authorizations(
+                scopes=[auth.scopes.CREATE_SUBMISSION,
+                        auth.scopes.EDIT_SUBMISSION,
+                        auth.scopes.VIEW_SUBMISSION],
+                endorsements=[domain.Category('astro-ph.CO'),
+                              domain.Category('astro-ph.GA')]
+            )
+        )
+        self.submission = mock.MagicMock(
+            submission_id=2,
+            is_announced=True,
+            primary_classification=mock.MagicMock(category='astro-ph.GA'),
+            secondary_categories=[]
+        )
+
+    @mock.patch(f'{cross.__name__}.CrossListForm.Meta.csrf', False)
+    @mock.patch('arxiv.submission.load')
+    def test_add_category(self, mock_load):
+        """The user adds a category to the selection."""
+        mock_load.return_value = (self.submission, [])
+        params = MultiDict([('selected', 'astro-ph.CO'),
+                            ('operation', cross.CrossListForm.ADD),
+                            ('category', 'astro-ph.EP')])
+        data, code, _ = cross.request_cross('POST', params, self.session, 2)
+        self.assertEqual(code, status.OK)
+        self.assertEqual(data['selected'], ['astro-ph.CO', 'astro-ph.EP'])
+        # The template renders ``selected``; the form must agree with it.
+        self.assertEqual(data['form'].selected.data, data['selected'])
+        self.assertEqual(data['form'].category.data, '',
+                         'The form is reset for the next category')
+        self.assertEqual(data['form'].operation.data, cross.CrossListForm.ADD)
+        self.assertEqual(set(data['formset']), {'astro-ph.CO', 'astro-ph.EP'})
+
+    @mock.patch(f'{cross.__name__}.CrossListForm.Meta.csrf', False)
+    @mock.patch('arxiv.submission.load')
+    def test_add_category_twice(self, mock_load):
+        """The user adds a category that is already selected."""
+        mock_load.return_value = (self.submission, [])
+        params = MultiDict([('selected', 'astro-ph.CO'),
+                            ('selected', 'astro-ph.EP'),
+                            ('operation', cross.CrossListForm.ADD),
+                            ('category', 'astro-ph.CO')])
+        data, code, _ = cross.request_cross('POST', params, self.session, 2)
+        self.assertEqual(code, status.OK)
+        self.assertEqual(data['selected'], ['astro-ph.CO', 'astro-ph.EP'],
+                         'The category is not selected twice')
+
+    @mock.patch(f'{cross.__name__}.CrossListForm.Meta.csrf', False)
+    @mock.patch('arxiv.submission.load')
+    def test_remove_category(self, mock_load):
+        """The user removes a selected category."""
+        mock_load.return_value = (self.submission, [])
+        params = MultiDict([('selected', 'astro-ph.CO'),
+                            ('selected', 'astro-ph.EP'),
+                            ('operation', cross.CrossListForm.REMOVE),
+                            ('category', 'astro-ph.CO')])
+        data, code, _ = cross.request_cross('POST', params, self.session, 2)
+        self.assertEqual(code, status.OK)
+        self.assertEqual(data['selected'], ['astro-ph.EP'])
+
+    @mock.patch(f'{cross.__name__}.CrossListForm.Meta.csrf', False)
+    @mock.patch('arxiv.submission.load')
+    def test_remove_category_not_selected(self, mock_load):
+        """The user removes a category that is not selected."""
+        mock_load.return_value = (self.submission, [])
+        params = MultiDict([('selected', 'astro-ph.CO'),
+                            ('operation', cross.CrossListForm.REMOVE),
+                            ('category', 'astro-ph.EP')])
+        data, code, _ = cross.request_cross('POST', params, self.session, 2)
+        self.assertEqual(code, status.OK)
+        self.assertEqual(data['selected'], ['astro-ph.CO'],
+                         'The selection is unchanged')
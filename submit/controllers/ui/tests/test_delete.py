@@ -0,0 +1,69 @@
+"""Tests for :mod:`submit.controllers.delete`."""
+
+from unittest import TestCase, mock
+from werkzeug.datastructures import MultiDict
+from werkzeug.exceptions import BadRequest
+from submit.controllers.ui import delete
+
+from pytz import timezone
+from datetime import timedelta, datetime
+from arxiv.users import auth, domain
+
+
+class TestDelete(TestCase):
+    """Test behavior of :func:`.delete` and :func:`.cancel_request`."""
+
+    def setUp(self):
+        """Create an authenticated session."""
+        # Specify the validity period for the session.
+        start = datetime.now(tz=timezone('US/Eastern'))
+        end = start + timedelta(seconds=36000)
+        self.session = domain.Session(
+            session_id='123-session-abc',
+            start_time=start, end_time=end,
+            user=domain.User(
+                user_id='235678',
+                email='foo@foo.com',
+                username='foouser',
+                name=domain.UserFullName("Jane", "Bloggs", "III"),
+                profile=domain.UserProfile(
+                    affiliation="FSU",
+                    rank=3,
+                    country="de",
+                    default_category=domain.Category('astro-ph.GA'),
+                    submission_groups=['grp_physics']
+                )
+            ),
+            authorizations=domain.Authorizations(
+                scopes=[auth.scopes.CREATE_SUBMISSION,
+                        auth.scopes.EDIT_SUBMISSION,
+                        auth.scopes.VIEW_SUBMISSION],
+                endorsements=[domain.Category('astro-ph.CO'),
+                              domain.Category('astro-ph.GA')]
+            )
+        )
+
+    @mock.patch(f'{delete.__name__}.DeleteForm.Meta.csrf', False)
+    @mock.patch(f'{delete.__name__}.save')
+    @mock.patch('arxiv.submission.load')
+    def test_delete_not_confirmed(self, mock_load, mock_save):
+        """The user POSTs without confirming the deletion."""
+        mock_load.return_value = (mock.MagicMock(submission_id=2), [])
+        with self.assertRaises(BadRequest):
+            delete.delete('POST', MultiDict(), self.session, 2)
+        self.assertEqual(mock_save.call_count, 0, "Nothing is saved")
+
+    @mock.patch(f'{delete.__name__}.CancelRequestForm.Meta.csrf', False)
+    @mock.patch(f'{delete.__name__}.save')
+    @mock.patch('arxiv.submission.load')
+    def test_cancel_request_not_confirmed(self, mock_load, mock_save):
+        """The user POSTs without confirming the cancellation."""
+        user_request = mock.MagicMock(request_id='2-foo-1')
+        user_request.is_pending.return_value = True
+        submission = mock.MagicMock(submission_id=2,
+                                    user_requests={'2-foo-1': user_request})
+        mock_load.return_value = (submission, [])
+        with self.assertRaises(BadRequest):
+            delete.cancel_request('POST', MultiDict(), self.session, 2,
+                                  '2-foo-1')
+        self.assertEqual(mock_save.call_count, 0, "Nothing is saved")
@@ -0,0 +1,148 @@
+"""Tests for :mod:`submit.controllers.ui.util`."""
+
+from unittest import TestCase
+from flask import Flask
+
+from pytz import timezone
+from datetime import timedelta, datetime
+from arxiv import taxonomy
+from arxiv.users import auth, domain
+
+from submit.controllers.ui import util
+
+
+class TestUserAndClientFromSession(TestCase):
+    """Tests for :func:`.user_and_client_from_session`."""
+
+    def setUp(self):
+        """Create an app, for its application global, and a session."""
+        self.app = Flask('test')
+        # Specify the validity period for the session.
+        start = datetime.now(tz=timezone('US/Eastern'))
+        end = start + timedelta(seconds=36000)
+        self.session = domain.Session(
+            session_id='123-session-abc',
+            start_time=start, end_time=end,
+            user=domain.User(
+                user_id='235678',
+                email='foo@foo.com',
+                username='foouser',
+                name=domain.UserFullName("Jane", "Bloggs", "III"),
+                profile=domain.UserProfile(
+                    affiliation="FSU",
+                    rank=3,
+                    country="de",
+                    default_category=domain.Category('astro-ph.GA'),
+                    submission_groups=['grp_physics']
+                )
+            ),
+            authorizations=domain.Authorizations(
+                scopes=[auth.scopes.CREATE_SUBMISSION,
+                        auth.scopes.EDIT_SUBMISSION,
+                        auth.scopes.VIEW_SUBMISSION],
+                endorsements=[domain.Category('astro-ph.CO'),
+                              domain.Category('astro-ph.GA')]
+            )
+        )
+
+    def test_same_session(self):
+        """The same session is looked up twice during a request."""
+        with self.app.app_context():
+            first = util.user_and_client_from_session(self.session)
+            second = util.user_and_client_from_session(self.session)
+        self.assertIs(first, second, "The cached result is returned")
+        user, client = first
+        self.assertEqual(user.native_id, '235678')
+        self.assertIsNone(client)
+
+    def test_different_session(self):
+        """A different session is looked up during the same request."""
+        other = self.session._replace(
+            session_id='456-session-def',
+            user=self.session.user._replace(user_id='98765',
+                                            email='bar@foo.com')
+        )
+        with self.app.app_context():
+            util.user_and_client_from_session(self.session)
+            user, _ = util.user_and_client_from_session(other)
+            self.assertEqual(user.native_id, '98765',
+                             "The other session's user is returned")
+            self.assertEqual(user.email, 'bar@foo.com')
+
+    def test_new_request(self):
+        """Each request starts without a cached result."""
+        with self.app.app_context():
+            first = util.user_and_client_from_session(self.session)
+        with self.app.app_context():
+            second = util.user_and_client_from_session(self.session)
+        self.assertIsNot(first, second)
+        self.assertEqual(first[0].native_id, second[0].native_id)
+
+
+class TestEndorsedCategories(TestCase):
+    """Tests for :func:`.endorsed_categories`."""
+
+    ENDORSEMENTS = [
+        (),
+        ('astro-ph.CO', 'astro-ph.GA'),
+        ('astro-ph.*',),
+        ('astro-ph.*', 'cs.AI'),
+        ('*.*',),
+    ]
+
+    def setUp(self):
+        """Create an authenticated session."""
+        # Specify the validity period for the session.
+        start = datetime.now(tz=timezone('US/Eastern'))
+        end = start + timedelta(seconds=36000)
+        self.session = domain.Session(
+            session_id='123-session-abc',
+            start_time=start, end_time=end,
+            user=domain.User(
+                user_id='235678',
+                email='foo@foo.com',
+                username='foouser',
+                name=domain.UserFullName("Jane", "Bloggs", "III"),
+                profile=domain.UserProfile(
+                    affiliation="FSU",
+                    rank=3,
+                    country="de",
+                    default_category=domain.Category('astro-ph.GA'),
+                    submission_groups=['grp_physics']
+                )
+            ),
+            authorizations=domain.Authorizations(
+                scopes=[auth.scopes.CREATE_SUBMISSION,
+                        auth.scopes.EDIT_SUBMISSION,
+                        auth.scopes.VIEW_SUBMISSION],
+                endorsements=[domain.Category('astro-ph.CO'),
+                              domain.Category('astro-ph.GA')]
+            )
+        )
+
+    def endorsed_for(self, *categories: str) -> domain.Session:
+        """Get the session, with the user endorsed for ``categories``."""
+        endorsements = [domain.Category(c) for c in categories]
+        return self.session._replace(
+            authorizations=self.session.authorizations._replace(
+                endorsements=endorsements
+            )
+        )
+
+    def test_endorsed_categories(self):
+        """Memoized lookups agree with :meth:`Authorizations.endorsed_for`."""
+        for endorsements in self.ENDORSEMENTS:
+            session = self.endorsed_for(*endorsements)
+            expected = {
+                category for category in taxonomy.CATEGORIES_ACTIVE
+                if session.authorizations.endorsed_for(category)
+            }
+            self.assertEqual(util.endorsed_categories(session), expected,
+                             f"Endorsed for {endorsements}")
+
+    def test_endorsement_order(self):
+        """The order of the endorsements does not matter."""
+        self.assertEqual(
+            util.endorsed_categories(self.endorsed_for('cs.AI', 'astro-ph.*')),
+            util.endorsed_categories(self.endorsed_for('astro-ph.*', 'cs.AI'))
+        )
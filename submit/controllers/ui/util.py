@@ -1,9 +1,11 @@
 """Helpers for controllers."""
 
-from typing import Callable, Any, Dict, Tuple, Optional, List, Union
+from functools import lru_cache
+from typing import Callable, Any, Dict, Tuple, Optional, List, Union, \
+    FrozenSet
 from http import HTTPStatus as status
 
-from werkzeug.datastructures import MultiDict
+from werkzeug.datastructures import MultiDict, ImmutableMultiDict
 from werkzeug.exceptions import InternalServerError, NotFound, BadRequest
 from flask import url_for, Markup
 
@@ -16,12 +18,16 @@ from wtforms.fields.core import UnboundField
 from arxiv.forms import csrf
 from http import HTTPStatus as status
 from arxiv import taxonomy
-from arxiv.users.domain import Session
+from arxiv.base.globals import get_application_global
+from arxiv.users.domain import Session, Authorizations
 from arxiv.submission import InvalidEvent, User, Client, Event, Submission
 
 
 Response = Tuple[Dict[str, Any], int, Dict[str, Any]]   # pylint: disable=C0103
 
+EMPTY_PARAMS: MultiDict = ImmutableMultiDict()
+"""Shared, read-only stand-in for request parameters that should be ignored."""
+
 
 class OptGroupSelectWidget(Select):
     """Select widget with optgroups."""
@@ -130,11 +136,20 @@ def validate_command(form: Form, event: Event,
 class FieldMixin:
     """Provide a convenience classmethod for field names."""
 
+    _field_names: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the field names once, when the form class is created."""
+        super().__init_subclass__(**kwargs)
+        cls._field_names = tuple(
+            key for key in dir(cls)
+            if isinstance(getattr(cls, key), UnboundField)
+        )
+
     @classmethod
-    def fields(cls):
+    def fields(cls) -> Tuple[str, ...]:
         """Convenience accessor for form field names."""
-        return [key for key in dir(cls)
-                if isinstance(getattr(cls, key), UnboundField)]
+        return cls._field_names
 
 
 # TODO: currently this does nothing with the client. We will need to add that
@@ -148,7 +163,15 @@ def user_and_client_from_session(session: Session) \
     submission-friendly representation of the user or client responsible for
     those events. This function generates those event-domain representations
     from a :class:`arxiv.users.domain.Submission` object.
+
+    The result is cached on the application global for the rest of the
+    request, as long as it is called with the same session.
     """
+    g = get_application_global()
+    cached = getattr(g, 'user_and_client', None) if g is not None else None
+    if cached is not None and cached[0] is session:
+        return cached[1]
+
     user = User(
         session.user.user_id,
         email=session.user.email,
@@ -157,7 +180,29 @@ def user_and_client_from_session(session: Session) \
         suffix=getattr(session.user.name, 'suffix', None),
         endorsements=session.authorizations.endorsements
     )
-    return user, None
+    user_and_client = (user, None)
+    if g is not None:
+        setattr(g, 'user_and_client', (session, user_and_client))
+    return user_and_client
+
+
+@lru_cache(maxsize=1024)
+def _endorsed_categories(endorsements: Tuple[str, ...]) -> FrozenSet[str]:
+    authorizations = Authorizations(endorsements=list(endorsements))
+    return frozenset(category for category in taxonomy.CATEGORIES_ACTIVE
+                     if authorizations.endorsed_for(category))
+
+
+def endorsed_categories(session: Session) -> FrozenSet[str]:
+    """
+    Get the active categories for which the session user is endorsed.
+
+    The result only depends on the user's endorsements, so it is cached
+    across requests for users with the same set of endorsements.
+    """
+    return _endorsed_categories(
+        tuple(sorted(session.authorizations.endorsements))
+    )
 
 
 def add_immediate_alert(context: dict, severity: str,
@@ -17,7 +17,8 @@ from arxiv.submission import save, SaveError
 from arxiv.submission.domain.event import RequestWithdrawal
 
 from ...util import load_submission
-from .util import FieldMixin, user_and_client_from_session, validate_command
+from .util import FieldMixin, user_and_client_from_session, \
+    validate_command, EMPTY_PARAMS
 
 logger = logging.getLogger(__name__)  # pylint: disable=C0103
 
@@ -40,7 +41,8 @@ def request_withdrawal(method: str, params: MultiDict, session: Session,
                        submission_id: int, **kwargs) -> Response:
     """Request withdrawal of a paper."""
     submitter, client = user_and_client_from_session(session)
-    logger.debug(f'method: {method}, submission: {submission_id}. {params}')
+    logger.debug('method: %s, submission: %s. %s', method, submission_id,
+                 params)
 
     # Will raise NotFound if there is no such submission.
     submission, _ = load_submission(submission_id)
@@ -58,10 +60,9 @@ def request_withdrawal(method: str, params: MultiDict, session: Session,
     # The form should be prepopulated based on the current state of the
     # submission.
     if method == 'GET':
-        params = MultiDict({})
+        params = EMPTY_PARAMS
 
-    params.setdefault("confirmed", False)
-    form = WithdrawalForm(params)
+    form = WithdrawalForm(params, confirmed=False)
     response_data = {
         'submission_id': submission_id,
         'submission': submission,
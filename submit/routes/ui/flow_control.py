@@ -28,6 +28,8 @@ EXIT = 'ui.create_submission'
 PREVIOUS = 'previous'
 NEXT = 'next'
 SAVE_EXIT = 'save_exit'
+FLOW_ACTIONS = frozenset((PREVIOUS, NEXT, SAVE_EXIT))
+"""Actions that navigate the workflow rather than act on the current stage."""
 
 
 FlowDecision = Literal['SHOW_CONTROLLER_RESULT', 'REDIRECT_EXIT',